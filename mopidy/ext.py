@@ -1,10 +1,14 @@
 from __future__ import annotations
 
+import functools
+import inspect
 import logging
+import operator
+import sys
 from collections.abc import Mapping
-from typing import TYPE_CHECKING, NamedTuple
-
-import pkg_resources
+from dataclasses import dataclass
+from importlib import metadata
+from typing import TYPE_CHECKING
 
 from mopidy import config as config_lib
 from mopidy import exceptions
@@ -23,8 +27,20 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger(__name__)
 
+_required_attrs = operator.attrgetter("dist_name", "ext_name", "version")
+
+
+@dataclass
+class ExtensionData:
+    # dataclass(slots=True) requires Python >= 3.10
+    __slots__ = (
+        "extension",
+        "entry_point",
+        "config_schema",
+        "config_defaults",
+        "command",
+    )
 
-class ExtensionData(NamedTuple):
     extension: Extension
     entry_point: Any
     config_schema: ConfigSchema
@@ -83,13 +99,7 @@ class Extension:
         :param config: the Mopidy config object
         :return: pathlib.Path
         """
-        if cls.ext_name is None:
-            raise AssertionError
-        cache_dir_path = (
-            path.expand_path(config["core"]["cache_dir"]) / cls.ext_name
-        )
-        path.get_or_create_dir(cache_dir_path)
-        return cache_dir_path
+        return cls._get_dir(config, "cache_dir")
 
     @classmethod
     def get_config_dir(cls, config: Config) -> Path:
@@ -98,13 +108,7 @@ class Extension:
         :param config: the Mopidy config object
         :return: pathlib.Path
         """
-        if cls.ext_name is None:
-            raise AssertionError
-        config_dir_path = (
-            path.expand_path(config["core"]["config_dir"]) / cls.ext_name
-        )
-        path.get_or_create_dir(config_dir_path)
-        return config_dir_path
+        return cls._get_dir(config, "config_dir")
 
     @classmethod
     def get_data_dir(cls, config: Config) -> Path:
@@ -115,13 +119,15 @@ class Extension:
         :param config: the Mopidy config object
         :returns: pathlib.Path
         """
+        return cls._get_dir(config, "data_dir")
+
+    @classmethod
+    def _get_dir(cls, config: Config, key: str) -> Path:
         if cls.ext_name is None:
             raise AssertionError
-        data_dir_path = (
-            path.expand_path(config["core"]["data_dir"]) / cls.ext_name
-        )
-        path.get_or_create_dir(data_dir_path)
-        return data_dir_path
+        dir_path = path.expand_path(config["core"][key]) / cls.ext_name
+        path.get_or_create_dir(dir_path)
+        return dir_path
 
     def get_command(self) -> Optional[Command]:
         """Command to expose to command line users running ``mopidy``.
@@ -188,6 +194,8 @@ class Registry(Mapping):
     e.g. ``local:foo`` or ``http:bar``.
     """
 
+    __slots__ = ("_registry",)
+
     def __init__(self) -> None:
         self._registry: dict[str, list[type[Any]]] = {}
 
@@ -199,7 +207,15 @@ class Registry(Mapping):
         self._registry.setdefault(name, []).append(cls)
 
     def __getitem__(self, name: str) -> list[type[Any]]:
-        return self._registry.setdefault(name, [])
+        """Get the components registered to ``name``.
+
+        If nothing has been registered to ``name``, an empty list is returned.
+        Looking up a name does not add it to the registry.
+        """
+        return self._registry.get(name, [])
+
+    def __contains__(self, name: object) -> bool:
+        return name in self._registry
 
     def __iter__(self) -> Iterator[str]:
         return iter(self._registry)
@@ -216,20 +232,17 @@ def load_extensions() -> list[ExtensionData]:
 
     installed_extensions = []
 
-    for entry_point in pkg_resources.iter_entry_points("mopidy.ext"):
+    for entry_point in _entry_points("mopidy.ext"):
         logger.debug("Loading entry point: %s", entry_point)
         try:
-            extension_class = entry_point.resolve()
+            extension_class = entry_point.load()
         except Exception as e:
             logger.exception(
                 f"Failed to load extension {entry_point.name}: {e}"
             )
             continue
 
-        try:
-            if not issubclass(extension_class, Extension):
-                raise TypeError  # issubclass raises TypeError on non-class
-        except TypeError:
+        if not _is_extension_class(extension_class):
             logger.error(
                 "Entry point %s did not contain a valid extension" "class: %r",
                 entry_point.name,
@@ -240,9 +253,7 @@ def load_extensions() -> list[ExtensionData]:
         try:
             extension = extension_class()
             # Ensure required extension attributes are present after try block
-            _ = extension.dist_name
-            _ = extension.ext_name
-            _ = extension.version
+            dist_name, _, version = _required_attrs(extension)
             extension_data = ExtensionData(
                 entry_point=entry_point,
                 extension=extension,
@@ -260,15 +271,63 @@ def load_extensions() -> list[ExtensionData]:
 
         installed_extensions.append(extension_data)
 
-        logger.debug(
-            "Loaded extension: %s %s", extension.dist_name, extension.version
-        )
+        logger.debug("Loaded extension: %s %s", dist_name, version)
 
-    names = (ed.extension.ext_name for ed in installed_extensions)
-    logger.debug("Discovered extensions: %s", ", ".join(names))
+    if logger.isEnabledFor(logging.DEBUG):
+        names = (ed.extension.ext_name for ed in installed_extensions)
+        logger.debug("Discovered extensions: %s", ", ".join(names))
     return installed_extensions
 
 
+def _is_extension_class(obj: Any) -> bool:
+    return inspect.isclass(obj) and issubclass(obj, Extension)
+
+
+@functools.cache
+def _entry_points(group: str) -> tuple[metadata.EntryPoint, ...]:
+    """Get the entry points in the given group.
+
+    The result is cached for the lifetime of the process, as looking up entry
+    points reads the metadata of every installed distribution. Entry points
+    registered after the first lookup will not be picked up.
+    """
+    if sys.version_info >= (3, 10):
+        return tuple(metadata.entry_points(group=group))
+    return tuple(metadata.entry_points().get(group, []))
+
+
+class _VersionConflict(Exception):
+    pass
+
+
+def _require(data: ExtensionData) -> None:
+    """Check that all requirements of the extension's distribution are met.
+
+    :raises: :exc:`importlib.metadata.PackageNotFoundError` if a requirement
+        is not installed, or :exc:`_VersionConflict` if the installed version
+        does not satisfy the requirement.
+    """
+    # Imported here, as it is only needed once extensions are validated
+    from packaging.requirements import Requirement
+
+    # EntryPoint.dist is only available on Python >= 3.10
+    dist = getattr(data.entry_point, "dist", None)
+    if dist is None:
+        dist = metadata.distribution(data.extension.dist_name)
+
+    for requirement_str in dist.requires or []:
+        requirement = Requirement(requirement_str)
+        if requirement.marker is not None and not requirement.marker.evaluate(
+            {"extra": ""}
+        ):
+            continue
+        found = metadata.version(requirement.name)
+        if not requirement.specifier.contains(found, prereleases=True):
+            raise _VersionConflict(
+                f"{requirement.name} {found}", str(requirement)
+            )
+
+
 def validate_extension_data(data: ExtensionData) -> bool:
     """Verify extension's dependencies and environment.
 
@@ -286,57 +345,21 @@ def validate_extension_data(data: ExtensionData) -> bool:
         )
         return False
 
-    try:
-        data.entry_point.require()
-    except pkg_resources.DistributionNotFound as exc:
-        logger.info(
-            "Disabled extension %s: Dependency %s not found",
-            data.extension.ext_name,
-            exc,
-        )
-        return False
-    except pkg_resources.VersionConflict as exc:
-        if len(exc.args) == 2:
-            found, required = exc.args
-            logger.info(
-                "Disabled extension %s: %s required, but found %s at %s",
-                data.extension.ext_name,
-                required,
-                found,
-                found.location,
-            )
-        else:
-            logger.info(
-                "Disabled extension %s: %s", data.extension.ext_name, exc
-            )
-        return False
-
-    try:
-        data.extension.validate_environment()
-    except exceptions.ExtensionError as exc:
-        logger.info("Disabled extension %s: %s", data.extension.ext_name, exc)
-        return False
-    except Exception:
-        logger.exception(
-            "Validating extension %s failed with an exception.",
-            data.extension.ext_name,
-        )
-        return False
-
     if not data.config_schema:
         logger.error(
             "Extension %s does not have a config schema, disabling.",
             data.extension.ext_name,
         )
         return False
-    elif not isinstance(data.config_schema.get("enabled"), config_lib.Boolean):
+
+    if not data.config_defaults:
         logger.error(
-            'Extension %s does not have the required "enabled" config'
-            " option, disabling.",
+            "Extension %s does not have a default config, disabling.",
             data.extension.ext_name,
         )
         return False
 
+    has_enabled = False
     for key, value in data.config_schema.items():
         if not isinstance(value, config_lib.ConfigValue):
             logger.error(
@@ -346,10 +369,44 @@ def validate_extension_data(data: ExtensionData) -> bool:
                 key,
             )
             return False
+        if key == "enabled" and isinstance(value, config_lib.Boolean):
+            has_enabled = True
 
-    if not data.config_defaults:
+    if not has_enabled:
         logger.error(
-            "Extension %s does not have a default config, disabling.",
+            'Extension %s does not have the required "enabled" config'
+            " option, disabling.",
+            data.extension.ext_name,
+        )
+        return False
+
+    try:
+        _require(data)
+    except metadata.PackageNotFoundError as exc:
+        logger.info(
+            "Disabled extension %s: Dependency %s not found",
+            data.extension.ext_name,
+            exc.args[0],
+        )
+        return False
+    except _VersionConflict as exc:
+        found, required = exc.args
+        logger.info(
+            "Disabled extension %s: %s required, but found %s",
+            data.extension.ext_name,
+            required,
+            found,
+        )
+        return False
+
+    try:
+        data.extension.validate_environment()
+    except exceptions.ExtensionError as exc:
+        logger.info("Disabled extension %s: %s", data.extension.ext_name, exc)
+        return False
+    except Exception:
+        logger.exception(
+            "Validating extension %s failed with an exception.",
             data.extension.ext_name,
         )
         return False
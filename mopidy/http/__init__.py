@@ -42,16 +42,18 @@ class Extension(ext.Extension):
         from .actor import HttpFrontend
         from .handlers import make_mopidy_app_factory
 
-        HttpFrontend.apps = registry["http:app"]
-        HttpFrontend.statics = registry["http:static"]
+        # The apps and statics are looked up in the registry when the server
+        # starts, so that those added by extensions set up after this one are
+        # included.
+        HttpFrontend.registry = registry
+
+        def mopidy_app_factory(config, core):
+            factory = make_mopidy_app_factory(
+                registry["http:app"], registry["http:static"]
+            )
+            return factory(config, core)
 
         registry.add("frontend", HttpFrontend)
         registry.add(
-            "http:app",
-            {
-                "name": "mopidy",
-                "factory": make_mopidy_app_factory(
-                    registry["http:app"], registry["http:static"]
-                ),
-            },
+            "http:app", {"name": "mopidy", "factory": mopidy_app_factory}
         )
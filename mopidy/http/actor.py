@@ -19,6 +19,7 @@ from mopidy.http import Extension, handlers
 from mopidy.internal import formatting, network
 
 if TYPE_CHECKING:
+    from collections.abc import Mapping
     from typing import Any, ClassVar
 
 try:
@@ -31,8 +32,7 @@ logger = logging.getLogger(__name__)
 
 
 class HttpFrontend(pykka.ThreadingActor, CoreListener):
-    apps: ClassVar[list[type[Any]]] = []
-    statics: ClassVar[list[type[Any]]] = []
+    registry: ClassVar[Mapping[str, list[Any]]] = {}
 
     def __init__(self, config, core):
         super().__init__()
@@ -50,8 +50,8 @@ class HttpFrontend(pykka.ThreadingActor, CoreListener):
                 config=config,
                 core=core,
                 sockets=sockets,
-                apps=self.apps,
-                statics=self.statics,
+                apps=self.registry.get("http:app", []),
+                statics=self.registry.get("http:static", []),
             )
         except OSError as exc:
             raise exceptions.FrontendError(f"HTTP server startup failed: {exc}")
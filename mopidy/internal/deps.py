@@ -2,8 +2,9 @@ import functools
 import os
 import platform
 import sys
+from importlib import metadata
 
-import pkg_resources
+from packaging.requirements import Requirement
 
 from mopidy.internal import formatting
 from mopidy.internal.gi import Gst, gi
@@ -12,9 +13,10 @@ from mopidy.internal.gi import Gst, gi
 def format_dependency_list(adapters=None):
     if adapters is None:
         dist_names = {
-            ep.dist.project_name
-            for ep in pkg_resources.iter_entry_points("mopidy.ext")
-            if ep.dist.project_name != "Mopidy"
+            dist.metadata["Name"]
+            for dist in metadata.distributions()
+            if any(ep.group == "mopidy.ext" for ep in dist.entry_points)
+            and dist.metadata["Name"] != "Mopidy"
         }
         dist_infos = [
             functools.partial(pkg_info, dist_name) for dist_name in dist_names
@@ -87,29 +89,34 @@ def pkg_info(
     if project_name is None:
         project_name = "Mopidy"
     try:
-        distribution = pkg_resources.get_distribution(project_name)
-        extras = include_extras and distribution.extras or []
-        if include_transitive_deps:
-            dependencies = [
-                pkg_info(
-                    d.project_name,
-                    include_transitive_deps=d.project_name != "Mopidy",
-                )
-                for d in distribution.requires(extras)
-            ]
-        else:
-            dependencies = []
-        return {
-            "name": project_name,
-            "version": distribution.version,
-            "path": distribution.location,
-            "dependencies": dependencies,
-        }
-    except pkg_resources.ResolutionError:
+        distribution = metadata.distribution(project_name)
+    except metadata.PackageNotFoundError:
         return {
             "name": project_name,
         }
 
+    if include_transitive_deps:
+        extras = [""]
+        if include_extras:
+            extras += distribution.metadata.get_all("Provides-Extra") or []
+        dependencies = [
+            pkg_info(
+                requirement.name,
+                include_transitive_deps=requirement.name != "Mopidy",
+            )
+            for requirement in map(Requirement, distribution.requires or [])
+            if requirement.marker is None
+            or any(requirement.marker.evaluate({"extra": e}) for e in extras)
+        ]
+    else:
+        dependencies = []
+    return {
+        "name": project_name,
+        "version": distribution.version,
+        "path": os.path.abspath(distribution.locate_file("")),
+        "dependencies": dependencies,
+    }
+
 
 def gstreamer_info():
     other = []
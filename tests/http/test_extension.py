@@ -1,7 +1,35 @@
+from unittest import mock
+
+import pytest
+
 from mopidy import config as config_lib
+from mopidy import ext
 from mopidy.http import Extension
 
 
+@pytest.fixture
+def registry(monkeypatch):
+    from mopidy.http import actor
+
+    monkeypatch.setattr(actor.HttpFrontend, "registry", {})
+    registry = ext.Registry()
+    Extension().setup(registry)
+    return registry
+
+
+@pytest.fixture
+def config():
+    return {
+        "http": {
+            "hostname": "127.0.0.1",
+            "port": 6680,
+            "zeroconf": "",
+            "allowed_origins": frozenset(),
+            "csrf_protection": True,
+        }
+    }
+
+
 def test_get_default_config():
     ext = Extension()
 
@@ -33,3 +61,36 @@ def test_default_config_is_valid():
     _, errors = config_lib.load([], [schema], [config], [])
 
     assert errors.get("http") is None
+
+
+def test_frontend_gets_apps_registered_after_setup(registry, config):
+    from mopidy.http import actor
+
+    app = {"name": "foo", "factory": mock.Mock()}
+    static = {"name": "bar", "path": "/tmp"}
+    registry.add("http:app", app)
+    registry.add("http:static", static)
+
+    (frontend_class,) = registry["frontend"]
+    with mock.patch.object(actor.tornado.netutil, "bind_sockets"):
+        with mock.patch.object(actor, "HttpServer") as server:
+            frontend_class(config=config, core=mock.Mock())
+
+    kwargs = server.call_args.kwargs
+    assert kwargs["apps"] == registry["http:app"]
+    assert app in kwargs["apps"]
+    assert kwargs["statics"] == [static]
+
+
+def test_mopidy_app_gets_apps_registered_after_setup(registry, config):
+    app = {"name": "foo", "factory": mock.Mock()}
+    static = {"name": "bar", "path": "/tmp"}
+    registry.add("http:app", app)
+    registry.add("http:static", static)
+
+    (mopidy_app,) = [a for a in registry["http:app"] if a["name"] == "mopidy"]
+    handlers = mopidy_app["factory"](config, mock.Mock())
+
+    client_list_kwargs = handlers[-1][2]
+    assert app in client_list_kwargs["apps"]
+    assert client_list_kwargs["statics"] == [static]
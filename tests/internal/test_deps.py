@@ -1,10 +1,10 @@
+import os
 import platform
 import sys
 import unittest
+from importlib import metadata
 from unittest import mock
 
-import pkg_resources
-
 from mopidy.internal import deps
 from mopidy.internal.gi import Gst, gi
 
@@ -79,27 +79,24 @@ class DepsTest(unittest.TestCase):
         assert gi.__version__ in result["other"]
         assert "Relevant elements:" in result["other"]
 
-    @mock.patch("pkg_resources.get_distribution")
-    def test_pkg_info(self, get_distribution_mock):
+    @mock.patch("importlib.metadata.distribution")
+    def test_pkg_info(self, distribution_mock):
         dist_setuptools = mock.Mock()
-        dist_setuptools.project_name = "setuptools"
         dist_setuptools.version = "0.6"
-        dist_setuptools.location = "/tmp/example/setuptools"
-        dist_setuptools.requires.return_value = []
+        dist_setuptools.locate_file.return_value = "/tmp/example/setuptools"
+        dist_setuptools.requires = None
 
         dist_pykka = mock.Mock()
-        dist_pykka.project_name = "Pykka"
         dist_pykka.version = "1.1"
-        dist_pykka.location = "/tmp/example/pykka"
-        dist_pykka.requires.return_value = [dist_setuptools]
+        dist_pykka.locate_file.return_value = "/tmp/example/pykka"
+        dist_pykka.requires = ["setuptools"]
 
         dist_mopidy = mock.Mock()
-        dist_mopidy.project_name = "Mopidy"
         dist_mopidy.version = "0.13"
-        dist_mopidy.location = "/tmp/example/mopidy"
-        dist_mopidy.requires.return_value = [dist_pykka]
+        dist_mopidy.locate_file.return_value = "/tmp/example/mopidy"
+        dist_mopidy.requires = ["Pykka >= 1.1", 'pytest; extra == "test"']
 
-        get_distribution_mock.side_effect = [
+        distribution_mock.side_effect = [
             dist_mopidy,
             dist_pykka,
             dist_setuptools,
@@ -110,6 +107,7 @@ class DepsTest(unittest.TestCase):
         assert "Mopidy" == result["name"]
         assert "0.13" == result["version"]
         assert "mopidy" in result["path"]
+        assert len(result["dependencies"]) == 1
 
         dep_info_pykka = result["dependencies"][0]
         assert "Pykka" == dep_info_pykka["name"]
@@ -119,19 +117,18 @@ class DepsTest(unittest.TestCase):
         assert "setuptools" == dep_info_setuptools["name"]
         assert "0.6" == dep_info_setuptools["version"]
 
-    @mock.patch("pkg_resources.get_distribution")
-    def test_pkg_info_for_missing_dist(self, get_distribution_mock):
-        get_distribution_mock.side_effect = pkg_resources.DistributionNotFound
+    @mock.patch("importlib.metadata.distribution")
+    def test_pkg_info_path_is_absolute(self, distribution_mock):
+        distribution_mock.return_value.requires = None
+        distribution_mock.return_value.locate_file.return_value = "."
 
         result = deps.pkg_info()
 
-        assert "Mopidy" == result["name"]
-        assert "version" not in result
-        assert "path" not in result
+        assert result["path"] == os.path.abspath(".")
 
-    @mock.patch("pkg_resources.get_distribution")
-    def test_pkg_info_for_wrong_dist_version(self, get_distribution_mock):
-        get_distribution_mock.side_effect = pkg_resources.VersionConflict
+    @mock.patch("importlib.metadata.distribution")
+    def test_pkg_info_for_missing_dist(self, distribution_mock):
+        distribution_mock.side_effect = metadata.PackageNotFoundError
 
         result = deps.pkg_info()
 
@@ -1,7 +1,8 @@
+import logging
 import pathlib
+from importlib import metadata
 from unittest import mock
 
-import pkg_resources
 import pytest
 
 from mopidy import config, exceptions, ext
@@ -71,10 +72,32 @@ class TestExtension:
             ext.Extension.get_data_dir(config)
 
 
+class TestRegistry:
+    def test_add(self):
+        registry = ext.Registry()
+
+        registry.add("foo", str)
+        registry.add("foo", int)
+
+        assert registry["foo"] == [str, int]
+
+    def test_get_missing_name(self):
+        registry = ext.Registry()
+
+        assert registry["foo"] == []
+        assert "foo" not in registry
+        assert len(registry) == 0
+
+    def test_has_no_instance_dict(self):
+        registry = ext.Registry()
+
+        assert not hasattr(registry, "__dict__")
+
+
 class TestLoadExtensions:
     @pytest.fixture
     def iter_entry_points_mock(self, request):
-        patcher = mock.patch("pkg_resources.iter_entry_points")
+        patcher = mock.patch.object(ext, "_entry_points")
         iter_entry_points = patcher.start()
         iter_entry_points.return_value = []
         yield iter_entry_points
@@ -86,7 +109,7 @@ class TestLoadExtensions:
 
     def test_load_extensions(self, iter_entry_points_mock):
         mock_entry_point = mock.Mock()
-        mock_entry_point.resolve.return_value = DummyExtension
+        mock_entry_point.load.return_value = DummyExtension
 
         iter_entry_points_mock.return_value = [mock_entry_point]
 
@@ -105,7 +128,7 @@ class TestLoadExtensions:
             pass
 
         mock_entry_point = mock.Mock()
-        mock_entry_point.resolve.return_value = WrongClass
+        mock_entry_point.load.return_value = WrongClass
 
         iter_entry_points_mock.return_value = [mock_entry_point]
 
@@ -113,7 +136,15 @@ class TestLoadExtensions:
 
     def test_gets_instance(self, iter_entry_points_mock):
         mock_entry_point = mock.Mock()
-        mock_entry_point.resolve.return_value = DummyExtension()
+        mock_entry_point.load.return_value = DummyExtension()
+
+        iter_entry_points_mock.return_value = [mock_entry_point]
+
+        assert ext.load_extensions() == []
+
+    def test_gets_unhashable_object(self, iter_entry_points_mock):
+        mock_entry_point = mock.Mock()
+        mock_entry_point.load.return_value = {}
 
         iter_entry_points_mock.return_value = [mock_entry_point]
 
@@ -124,7 +155,19 @@ class TestLoadExtensions:
         mock_extension.side_effect = Exception
 
         mock_entry_point = mock.Mock()
-        mock_entry_point.resolve.return_value = mock_extension
+        mock_entry_point.load.return_value = mock_extension
+
+        iter_entry_points_mock.return_value = [mock_entry_point]
+
+        assert ext.load_extensions() == []
+
+    def test_missing_required_attribute(self, iter_entry_points_mock):
+        class NoVersionExtension(ext.Extension):
+            dist_name = "Mopidy-Foobar"
+            ext_name = "foobar"
+
+        mock_entry_point = mock.Mock()
+        mock_entry_point.load.return_value = NoVersionExtension
 
         iter_entry_points_mock.return_value = [mock_entry_point]
 
@@ -132,7 +175,7 @@ class TestLoadExtensions:
 
     def test_get_config_schema_fails(self, iter_entry_points_mock):
         mock_entry_point = mock.Mock()
-        mock_entry_point.resolve.return_value = DummyExtension
+        mock_entry_point.load.return_value = DummyExtension
 
         iter_entry_points_mock.return_value = [mock_entry_point]
 
@@ -144,7 +187,7 @@ class TestLoadExtensions:
 
     def test_get_default_config_fails(self, iter_entry_points_mock):
         mock_entry_point = mock.Mock()
-        mock_entry_point.resolve.return_value = DummyExtension
+        mock_entry_point.load.return_value = DummyExtension
 
         iter_entry_points_mock.return_value = [mock_entry_point]
 
@@ -156,7 +199,7 @@ class TestLoadExtensions:
 
     def test_get_command_fails(self, iter_entry_points_mock):
         mock_entry_point = mock.Mock()
-        mock_entry_point.resolve.return_value = DummyExtension
+        mock_entry_point.load.return_value = DummyExtension
 
         iter_entry_points_mock.return_value = [mock_entry_point]
 
@@ -167,6 +210,56 @@ class TestLoadExtensions:
             get.assert_called_once_with()
 
 
+class TestEntryPoints:
+    @pytest.fixture(autouse=True)
+    def clear_cache(self):
+        ext._entry_points.cache_clear()
+        yield
+        ext._entry_points.cache_clear()
+
+    def test_entry_points_are_cached(self):
+        with mock.patch.object(ext.sys, "version_info", (3, 10)):
+            with mock.patch.object(metadata, "entry_points") as entry_points:
+                entry_points.return_value = []
+
+                assert ext._entry_points("mopidy.ext") == ()
+                assert ext._entry_points("mopidy.ext") == ()
+
+        entry_points.assert_called_once()
+
+    def test_entry_points(self):
+        with mock.patch.object(ext.sys, "version_info", (3, 10)):
+            with mock.patch.object(metadata, "entry_points") as entry_points:
+                entry_points.return_value = [mock.sentinel.entry_point]
+
+                result = ext._entry_points("mopidy.ext")
+
+        assert result == (mock.sentinel.entry_point,)
+        entry_points.assert_called_once_with(group="mopidy.ext")
+
+    def test_entry_points_on_python_3_9(self):
+        with mock.patch.object(ext.sys, "version_info", (3, 9)):
+            with mock.patch.object(metadata, "entry_points") as entry_points:
+                entry_points.return_value = {
+                    "mopidy.ext": [mock.sentinel.entry_point],
+                    "console_scripts": [mock.sentinel.script],
+                }
+
+                result = ext._entry_points("mopidy.ext")
+
+        assert result == (mock.sentinel.entry_point,)
+        entry_points.assert_called_once_with()
+
+    def test_entry_points_on_python_3_9_without_group(self):
+        with mock.patch.object(ext.sys, "version_info", (3, 9)):
+            with mock.patch.object(metadata, "entry_points") as entry_points:
+                entry_points.return_value = {}
+
+                result = ext._entry_points("mopidy.ext")
+
+        assert result == ()
+
+
 class TestValidateExtensionData:
     @pytest.fixture
     def ext_data(self):
@@ -174,6 +267,7 @@ class TestValidateExtensionData:
 
         entry_point = mock.Mock()
         entry_point.name = extension.ext_name
+        entry_point.dist.requires = []
 
         schema = extension.get_config_schema()
         defaults = extension.get_default_config()
@@ -187,24 +281,47 @@ class TestValidateExtensionData:
         ext_data.entry_point.name = "barfoo"
         assert not ext.validate_extension_data(ext_data)
 
-    def test_distribution_not_found(self, ext_data):
-        error = pkg_resources.DistributionNotFound
-        ext_data.entry_point.require.side_effect = error
+    def test_valid_extension(self, ext_data):
+        assert ext.validate_extension_data(ext_data)
+
+    def test_distribution_not_found(self, ext_data, caplog):
+        caplog.set_level(logging.INFO)
+        ext_data.entry_point.dist.requires = ["Mopidy-NotInstalled"]
+
         assert not ext.validate_extension_data(ext_data)
+        assert "Dependency Mopidy-NotInstalled not found" in caplog.text
+
+    def test_distribution_looked_up_by_dist_name(self, ext_data):
+        # EntryPoint.dist is not available on Python 3.9
+        ext_data.entry_point.dist = None
+        with mock.patch.object(metadata, "distribution") as distribution:
+            distribution.return_value.requires = None
+
+            assert ext.validate_extension_data(ext_data)
+            distribution.assert_called_once_with("Mopidy-Foobar")
 
     def test_version_conflict(self, ext_data):
-        error = pkg_resources.VersionConflict
-        ext_data.entry_point.require.side_effect = error
+        ext_data.entry_point.dist.requires = ["pytest < 1.0"]
         assert not ext.validate_extension_data(ext_data)
 
+    def test_version_satisfied(self, ext_data):
+        ext_data.entry_point.dist.requires = ["pytest >= 1.0"]
+        assert ext.validate_extension_data(ext_data)
+
+    def test_requirement_with_unmet_marker_is_ignored(self, ext_data):
+        ext_data.entry_point.dist.requires = [
+            'Mopidy-NotInstalled; extra == "test"'
+        ]
+        assert ext.validate_extension_data(ext_data)
+
     def test_entry_point_require_exception(self, ext_data):
-        ext_data.entry_point.require.side_effect = Exception(
-            "Some extension error"
-        )
+        with mock.patch.object(metadata, "version") as version:
+            version.side_effect = Exception("Some extension error")
+            ext_data.entry_point.dist.requires = ["pytest"]
 
-        # Hope that entry points are well behaved, so exception will bubble.
-        with pytest.raises(Exception, match="Some extension error"):
-            assert not ext.validate_extension_data(ext_data)
+            # Hope that entry points are well behaved, so exception will bubble.
+            with pytest.raises(Exception, match="Some extension error"):
+                assert not ext.validate_extension_data(ext_data)
 
     def test_extenions_validate_environment_error(self, ext_data):
         extension = ext_data.extension
@@ -223,9 +340,17 @@ class TestValidateExtensionData:
             validate.assert_called_once_with()
 
     def test_missing_schema(self, ext_data):
-        ext_data = ext_data._replace(config_schema=None)
+        ext_data.config_schema = None
         assert not ext.validate_extension_data(ext_data)
 
+    def test_missing_schema_skips_slow_checks(self, ext_data):
+        ext_data.config_schema = None
+        extension = ext_data.extension
+        with mock.patch.object(extension, "validate_environment") as validate:
+            assert not ext.validate_extension_data(ext_data)
+
+        validate.assert_not_called()
+
     def test_schema_that_is_missing_enabled(self, ext_data):
         del ext_data.config_schema["enabled"]
         ext_data.config_schema["baz"] = config.String()
@@ -239,8 +364,15 @@ class TestValidateExtensionData:
         ext_data.config_schema["baz"] = 123
         assert not ext.validate_extension_data(ext_data)
 
+    def test_changed_schema_is_checked(self, ext_data):
+        assert ext.validate_extension_data(ext_data)
+
+        ext_data.config_schema["baz"] = 123
+
+        assert not ext.validate_extension_data(ext_data)
+
     def test_no_default_config(self, ext_data):
-        ext_data = ext_data._replace(config_defaults=None)
+        ext_data.config_defaults = None
         assert not ext.validate_extension_data(ext_data)
 
     def test_get_cache_dir(self, ext_data):
@@ -275,3 +407,13 @@ class TestValidateExtensionData:
 
         expected = pathlib.Path(core_data_dir) / extension.ext_name
         assert data_dir == expected
+
+    def test_get_data_dir_recreates_removed_dir(self, ext_data, tmp_path):
+        config = {"core": {"data_dir": str(tmp_path)}}
+        extension = ext_data.extension
+
+        data_dir = extension.get_data_dir(config)
+        data_dir.rmdir()
+
+        assert extension.get_data_dir(config) == data_dir
+        assert data_dir.is_dir()